@@ -3,6 +3,8 @@ import asyncio
 import logging
 from typing import Any, Optional
 
+import aiohttp
+
 from .ariston_api import AristonAPI, ConnectionException
 from .const import (
     ARISTON_API_URL,
@@ -43,16 +45,21 @@ class Ariston:
         self.cloud_devices: list[dict[str, Any]] = []
 
     async def async_connect(
-        self, username: str, password: str, api_url: str = ARISTON_API_URL, user_agent: str = ARISTON_USER_AGENT
+        self,
+        username: str,
+        password: str,
+        api_url: str = ARISTON_API_URL,
+        user_agent: str = ARISTON_USER_AGENT,
+        session: Optional[aiohttp.ClientSession] = None,
     ) -> bool:
         """Connect to the ariston cloud"""
-        self.api = AristonAPI(username, password, api_url, user_agent)
+        self.api = AristonAPI(username, password, api_url, user_agent, session)
         return await self.api.async_connect()
 
     async def async_discover(self) -> list[dict[str, Any]]:
         """Retreive ariston devices from the cloud"""
         if self.api is None:
-            _LOGGER.exception("Call async_connect first")
+            _LOGGER.error("Call async_connect first")
             return []
         cloud_devices = await _async_discover(self.api)
         self.cloud_devices = cloud_devices
@@ -63,10 +70,10 @@ class Ariston:
     ) -> Optional[AristonBaseDevice]:
         """Get ariston device"""
         if self.api is None:
-            _LOGGER.exception("Call async_connect() first")
+            _LOGGER.error("Call async_connect() first")
             return None
 
-        if len(self.cloud_devices) == 0:
+        if not self.cloud_devices:
             await self.async_discover()
 
         return _get_device(
@@ -87,7 +94,7 @@ def _get_device(
         None,
     )
     if device is None:
-        _LOGGER.exception("No device %s found.", gateway)
+        _LOGGER.error("No device %s found.", gateway)
         return None
 
     system_type = device.get(DeviceAttribute.SYS)
@@ -104,14 +111,14 @@ def _get_device(
             whe_type = device.get(VelisDeviceAttribute.WHE_TYPE, None)
             device_class = _MAP_WHE_TYPES_TO_CLASS.get(whe_type, None)
             if device_class is None:
-                _LOGGER.exception("Unsupported whe type %s", whe_type)
+                _LOGGER.error("Unsupported whe type %s", whe_type)
                 return None
             return device_class(api, device)
 
         case SystemType.BSB.value:
             return AristonBsbDevice(api, device)
         case _:
-            _LOGGER.exception("Unsupported system type %s", system_type)
+            _LOGGER.error("Unsupported system type %s", system_type)
             return None
 
 
@@ -192,3 +199,19 @@ async def async_hello(
     api = await _async_connect(username, password, api_url)
     cloud_devices = await _async_discover(api)
     return _get_device(cloud_devices, api, gateway, is_metric, language_tag)
+
+
+async def async_update_devices(
+    devices: list[AristonBaseDevice],
+) -> dict[str, BaseException]:
+    """Async update the device states concurrently and return the failures by gateway"""
+    results = await asyncio.gather(
+        *(device.async_update_state() for device in devices),
+        return_exceptions=True,
+    )
+    failures: dict[str, BaseException] = dict()
+    for device, result in zip(devices, results):
+        if isinstance(result, BaseException):
+            _LOGGER.error("Failed to update device %s: %r", device.gw, result)
+            failures[device.gw] = result
+    return failures
@@ -2,10 +2,12 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import asyncio
+import copy
 import aiohttp
 import requests
 
@@ -46,33 +48,53 @@ class ConnectionException(Exception):
 class AristonAPI:
     """Ariston API class"""
 
-    def __init__(self, username: str, password: str, api_url: str = ARISTON_API_URL, user_agent: str = ARISTON_USER_AGENT) -> None:
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        api_url: str = ARISTON_API_URL,
+        user_agent: str = ARISTON_USER_AGENT,
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> None:
         """Constructor for Ariston API."""
         self.__username = username
         self.__password = password
         self.__api_url = api_url
         self.__token = ""
         self.__user_agent = user_agent
+        self.__session = session
+        self.__pending_gets: dict[
+            str, tuple[asyncio.Future[Any], list[asyncio.Future[Any]]]
+        ] = dict()
+        self.__login_lock = threading.RLock()
 
     def connect(self) -> bool:
         """Login to ariston cloud and get token"""
 
         try:
-            response = self._post(
-                f"{self.__api_url}{ARISTON_LOGIN}",
-                {"usr": self.__username, "pwd": self.__password},
-            )
+            with self.__login_lock:
+                response = self._post(
+                    f"{self.__api_url}{ARISTON_LOGIN}",
+                    {"usr": self.__username, "pwd": self.__password},
+                )
 
-            if response is None:
-                return False
+                if response is None:
+                    return False
 
-            self.__token = response["token"]
+                self.__token = response["token"]
 
-            return True
+                return True
 
         except Exception as error:
             raise ConnectionException() from error
 
+    def __reconnect(self, expired_token: str) -> bool:
+        """Login again unless another thread already replaced the expired token"""
+        with self.__login_lock:
+            if self.__token != expired_token:
+                return True
+            return self.connect()
+
     def get_detailed_devices(self) -> list[Any]:
         """Get detailed cloud devices"""
         devices = self._get(f"{self.__api_url}{ARISTON_REMOTE}/{ARISTON_PLANTS}")
@@ -449,7 +471,8 @@ class AristonAPI:
         is_retry: bool = False,
     ) -> Optional[dict[str, Any]]:
         """Request with requests"""
-        headers = {"User-Agent": self.__user_agent, "ar.authToken": self.__token}
+        token = self.__token
+        headers = {"User-Agent": self.__user_agent, "ar.authToken": token}
 
         _LOGGER.debug(
             "Request method %s, path: %s, params: %s",
@@ -464,7 +487,7 @@ class AristonAPI:
             match response.status_code:
                 case 405:
                     if not is_retry:
-                        if self.connect():
+                        if self.__reconnect(token):
                             return self.__request(method, path, params, body, True)
                         raise Exception("Login failed (password changed?)")
                     raise Exception("Invalid token")
@@ -896,11 +919,30 @@ class AristonAPI:
             params,
         )
 
-        async with aiohttp.ClientSession() as session:
-            response = await session.request(
-                method, path, params=params, json=body, headers=headers
-            )
+        if self.__session is None:
+            async with aiohttp.ClientSession() as session:
+                return await self.__async_session_request(
+                    session, method, path, params, body, headers, is_retry
+                )
+        # Reuse the caller's session to keep the connections alive between requests
+        return await self.__async_session_request(
+            self.__session, method, path, params, body, headers, is_retry
+        )
 
+    async def __async_session_request(
+        self,
+        session: aiohttp.ClientSession,
+        method: str,
+        path: str,
+        params: Optional[dict[str, Any]],
+        body: Any,
+        headers: dict[str, str],
+        is_retry: bool,
+    ) -> Optional[dict[str, Any]]:
+        """Async request with the given aiohttp session"""
+        async with session.request(
+            method, path, params=params, json=body, headers=headers
+        ) as response:
             if not response.ok:
                 match response.status:
                     case 405:
@@ -933,10 +975,64 @@ class AristonAPI:
 
     async def _async_post(self, path: str, body: Any) -> Any:
         """Async POST request"""
-        return await self.__async_request("POST", path, None, body)
+        # A GET started before or during the write must not be shared with later callers
+        self.__pending_gets.clear()
+        try:
+            return await self.__async_request("POST", path, None, body)
+        finally:
+            self.__pending_gets.clear()
 
     async def _async_get(
         self, path: str, params: Optional[dict[str, Any]] = None
     ) -> Any:
         """Async GET request"""
-        return await self.__async_request("GET", path, params, None)
+        if params is not None:
+            return await self.__async_request("GET", path, params, None)
+
+        # Concurrent callers of the same GET share one request
+        pending = self.__pending_gets.get(path)
+        if pending is None:
+            request = asyncio.ensure_future(
+                self.__async_request("GET", path, None, None)
+            )
+            pending = (request, list[asyncio.Future[Any]]())
+            self.__pending_gets[path] = pending
+            request.add_done_callback(self.__resolve_pending_get(path, pending))
+        request, waiters = pending
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            return await waiter
+        except asyncio.CancelledError:
+            waiters.remove(waiter)
+            # Nobody is left waiting for the response
+            if not waiters:
+                request.cancel()
+            raise
+
+    def __resolve_pending_get(
+        self,
+        path: str,
+        pending: tuple[asyncio.Future[Any], list[asyncio.Future[Any]]],
+    ) -> Callable[[asyncio.Future[Any]], None]:
+        """Return a callback handing the finished GET to its waiters"""
+
+        def resolve(request: asyncio.Future[Any]) -> None:
+            if self.__pending_gets.get(path) is pending:
+                del self.__pending_gets[path]
+            waiters = [waiter for waiter in pending[1] if not waiter.done()]
+            if request.cancelled():
+                for waiter in waiters:
+                    waiter.cancel()
+                return
+            error = request.exception()
+            if error is not None:
+                for waiter in waiters:
+                    waiter.set_exception(error)
+                return
+            # The first waiter gets the response itself, the others their own copy
+            result = request.result()
+            for index, waiter in enumerate(waiters):
+                waiter.set_result(result if index == 0 else copy.deepcopy(result))
+
+        return resolve
@@ -1,9 +1,11 @@
 """Device class for Ariston module."""
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
 import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
 from .ariston_api import AristonAPI
@@ -21,10 +23,32 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_CONSUMPTION_TYPES: tuple[tuple[ConsumptionType, str], ...] = tuple(
+    (consumption_type, consumption_type.name) for consumption_type in ConsumptionType
+)
+
+_EPOCH_UTC = dt.datetime.fromtimestamp(0, dt.timezone.utc)
+_ONE_HOUR = dt.timedelta(hours=1)
+
 
 class AristonBaseDevice(ABC):
     """Class representing a physical device, it's state and properties."""
 
+    __slots__ = (
+        "api",
+        "attributes",
+        "features",
+        "custom_features",
+        "consumptions_sequences",
+        "_consumptions_sequences_index",
+        "data",
+        "consumption_sequence_last_changed_utc",
+        "gw",
+        "bus_errors_list",
+        "_system_type",
+        "_whe_type",
+    )
+
     def __init__(
         self,
         api: AristonAPI,
@@ -36,11 +60,22 @@ class AristonBaseDevice(ABC):
         self.features: dict[str, Any] = dict()
         self.custom_features: dict[str, Any] = dict()
         self.consumptions_sequences: list[dict[str, Any]] = list()
+        self._consumptions_sequences_index: dict[tuple[int, int], list[Any]] = dict()
         self.data: dict[str, Any] = dict()
-        self.consumption_sequence_last_changed_utc: dt.datetime = (
-            dt.datetime.fromtimestamp(0, dt.UTC).replace(tzinfo=dt.timezone.utc)
-        )
+        self.consumption_sequence_last_changed_utc: dt.datetime = _EPOCH_UTC
         self.gw: str = self.attributes.get(DeviceAttribute.GW, "")
+        try:
+            self._system_type = SystemType(
+                self.attributes.get(DeviceAttribute.SYS, SystemType.UNKNOWN)
+            )
+        except ValueError:
+            self._system_type = SystemType.UNKNOWN
+        try:
+            self._whe_type = WheType(
+                self.attributes.get(VelisDeviceAttribute.WHE_TYPE, WheType.Unknown)
+            )
+        except ValueError:
+            self._whe_type = WheType.Unknown
         self.bus_errors_list: list[dict[str, Any]] = []
 
     @property
@@ -54,6 +89,7 @@ class AristonBaseDevice(ABC):
             self.gw,
             self.consumption_type,
         )
+        self._index_consumptions_sequences()
 
     async def _async_get_consumptions_sequences(self) -> None:
         """Async get consumption sequence"""
@@ -61,18 +97,25 @@ class AristonBaseDevice(ABC):
             self.gw,
             self.consumption_type,
         )
+        self._index_consumptions_sequences()
+
+    def _index_consumptions_sequences(self) -> None:
+        """Index consumption sequence values by consumption type and time interval"""
+        # Reversed so the first sequence wins if the cloud sends duplicates
+        self._consumptions_sequences_index = {
+            (sequence["k"], sequence["p"]): sequence["v"]
+            for sequence in reversed(self.consumptions_sequences)
+        }
 
     @property
     def system_type(self) -> SystemType:
         """Get device system type wrapper"""
-        return SystemType(self.attributes.get(DeviceAttribute.SYS, SystemType.UNKNOWN))
+        return self._system_type
 
     @property
     def whe_type(self) -> WheType:
         """Get device whe type wrapper"""
-        return WheType(
-            self.attributes.get(VelisDeviceAttribute.WHE_TYPE, WheType.Unknown)
-        )
+        return self._whe_type
 
     @property
     def whe_model_type(self) -> int:
@@ -138,10 +181,11 @@ class AristonBaseDevice(ABC):
     def water_heater_current_mode_text(self) -> str:
         """Get water heater current mode text"""
         mode = self.water_heater_mode_value
-        if mode in self.water_heater_mode_options:
+        try:
             index = self.water_heater_mode_options.index(mode)
-            return self.water_heater_mode_operation_texts[index]
-        return "UNKNOWN"
+        except ValueError:
+            return "UNKNOWN"
+        return self.water_heater_mode_operation_texts[index]
 
     @abstractmethod
     def update_state(self) -> None:
@@ -153,6 +197,16 @@ class AristonBaseDevice(ABC):
         """Async update the device states from the cloud"""
         raise NotImplementedError
 
+    def _ensure_loaded(self) -> None:
+        """Update the device states if they were not fetched yet"""
+        if not self.data:
+            self.update_state()
+
+    async def _async_ensure_loaded(self) -> None:
+        """Async update the device states if they were not fetched yet"""
+        if not self.data:
+            await self.async_update_state()
+
     @property
     @abstractmethod
     def water_heater_current_temperature(self) -> Optional[float]:
@@ -257,11 +311,24 @@ class AristonBaseDevice(ABC):
         time_interval: ConsumptionTimeInterval,
     ) -> Any:
         """Get last value for consumption sequence"""
-        for sequence in self.consumptions_sequences:
-            if sequence["k"] == consumption_type.value and sequence["p"] == time_interval.value:
-                return sequence["v"][-1]
+        values = self._consumptions_sequences_index.get(
+            (consumption_type.value, time_interval.value)
+        )
+        if values is None:
+            return None
+        return values[-1]
 
-        return None
+    def get_all_consumptions(
+        self,
+        time_interval: ConsumptionTimeInterval = ConsumptionTimeInterval.LAST_DAY,
+    ) -> dict[ConsumptionType, Any]:
+        """Get last value for every consumption sequence of the time interval"""
+        return {
+            consumption_type: self._get_consumption_sequence_last_value(
+                consumption_type, time_interval
+            )
+            for consumption_type, _ in _CONSUMPTION_TYPES
+        }
 
     def _update_energy(self, old_consumptions_sequences: Optional[list[dict[str, Any]]]) -> None:
         """Update the device energy settings"""
@@ -278,9 +345,9 @@ class AristonBaseDevice(ABC):
             and len(old_consumptions_sequences) > 0
             and old_consumptions_sequences != self.consumptions_sequences
         ):
-            self.consumption_sequence_last_changed_utc = dt.datetime.now(
-                dt.timezone.utc
-            ) - dt.timedelta(hours=1)
+            self.consumption_sequence_last_changed_utc = (
+                dt.datetime.now(dt.timezone.utc) - _ONE_HOUR
+            )
 
     def update_energy(self) -> None:
         """Update the device energy settings from the cloud"""
@@ -302,19 +369,41 @@ class AristonBaseDevice(ABC):
         """Async get bus errors from the cloud"""
         self.bus_errors_list = await self.api.async_get_bus_errors(self.gw)
 
+    def update_all(self) -> None:
+        """Update the device features, energy settings and bus errors from the cloud"""
+        # The energy features depend on the device features, so load those first
+        self.get_features()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(self.update_energy),
+                executor.submit(self.get_bus_errors),
+            ]
+        for future in futures:
+            future.result()
+
+    async def async_update_all(self) -> None:
+        """Async update the device features, energy settings and bus errors from the cloud"""
+        # The energy features depend on the device features, so load those first
+        features_loaded = bool(self.features)
+        if not features_loaded:
+            await self.async_get_features()
+        coroutines = [self.async_update_energy(), self.async_get_bus_errors()]
+        if features_loaded:
+            coroutines.append(self.async_get_features())
+        await asyncio.gather(*coroutines)
+
     def _set_energy_features(self):
         """Set energy features"""
-        for consumption_type in ConsumptionType:
-            if (
-                self._get_consumption_sequence_last_value(
+        self.custom_features.update(
+            {
+                name: self._get_consumption_sequence_last_value(
                     consumption_type,
                     ConsumptionTimeInterval.LAST_DAY,
                 )
                 is not None
-            ):
-                self.custom_features[consumption_type.name] = True
-            else:
-                self.custom_features[consumption_type.name] = False
+                for consumption_type, name in _CONSUMPTION_TYPES
+            }
+        )
 
     def are_device_features_available(
         self,
@@ -330,11 +419,14 @@ class AristonBaseDevice(ABC):
             return False
 
         if device_features is not None:
+            features = self.features
+            custom_features = self.custom_features
+            attributes = self.attributes
             for device_feature in device_features:
                 if (
-                    self.features.get(device_feature) is not True
-                    and self.custom_features.get(device_feature) is not True
-                    and self.attributes.get(device_feature) is not True
+                    features.get(device_feature) is not True
+                    and custom_features.get(device_feature) is not True
+                    and attributes.get(device_feature) is not True
                 ):
                     return False
 
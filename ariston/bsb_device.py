@@ -2,6 +2,7 @@
 import logging
 from typing import Any, Optional
 
+from .ariston_api import AristonAPI
 from .const import (
     BsbDeviceProperties,
     BsbOperativeMode,
@@ -14,31 +15,63 @@ from .device import AristonDevice
 
 _LOGGER = logging.getLogger(__name__)
 
+_BSB_ZONE_MODE_BY_VALUE: dict[int, BsbZoneMode] = {
+    zone_mode.value: zone_mode for zone_mode in BsbZoneMode
+}
+_BSB_ZONE_MANUAL_MODES = frozenset({BsbZoneMode.MANUAL, BsbZoneMode.MANUAL_NIGHT})
+_BSB_ZONE_TIME_PROGRAM_MODES = frozenset({BsbZoneMode.TIME_PROGRAM})
+_BSB_OPERATIVE_MODE_TEXTS = tuple(flag.name for flag in BsbOperativeMode)
+_BSB_OPERATIVE_MODE_OPTIONS = tuple(flag.value for flag in BsbOperativeMode)
+_BSB_OPERATIVE_MODE_BY_NAME = BsbOperativeMode.__members__
+
 
 class AristonBsbDevice(AristonDevice):
     """Class representing a physical device, it's state and properties."""
 
-    @property
-    def consumption_type(self) -> str:
-        """String to get consumption type"""
-        return f"Ch{'%2CDhw'}"
-
-    @property
-    def plant_mode_supported(self) -> bool:
-        """Returns is plant mode supported"""
-        return False
+    __slots__ = ("_zone_numbers", "_zones_by_number", "_primary_zone")
+
+    _BSB_FEATURES: dict[str, Any] = {
+        CustomDeviceFeatures.HAS_DHW: True,
+        CustomDeviceFeatures.HAS_OUTSIDE_TEMP: True,
+    }
+
+    consumption_type: str = "Ch%2CDhw"
+    plant_mode_supported: bool = False
+    water_heater_temperature_decimals: int = 1
+    water_heater_temperature_unit: str = "°C"
+    outside_temp_unit: str = "°C"
+
+    def __init__(
+        self,
+        api: AristonAPI,
+        attributes: dict[str, Any],
+    ) -> None:
+        super().__init__(api, attributes)
+        self._zone_numbers: list[int] = list()
+        self._zones_by_number: dict[int, dict[str, Any]] = dict()
+        self._primary_zone: dict[str, Any] = dict()
 
     def update_state(self) -> None:
         """Update the device states from the cloud."""
         self.data = self.api.get_bsb_plant_data(self.gw)
+        self._update_zones()
 
     async def async_update_state(self) -> None:
         """Async update the device states from the cloud."""
         self.data = await self.api.async_get_bsb_plant_data(self.gw)
+        self._update_zones()
+
+    def _update_zones(self) -> None:
+        """Index the zones of the current data by zone number"""
+        self._zones_by_number = {
+            int(zone): zone_data for zone, zone_data in self.zones.items()
+        }
+        self._zone_numbers = list(self._zones_by_number)
+        self._primary_zone = next(iter(self._zones_by_number.values()), dict())
 
     def _get_features(self) -> None:
-        self.custom_features[CustomDeviceFeatures.HAS_DHW] = True
-        self.custom_features[CustomDeviceFeatures.HAS_OUTSIDE_TEMP] = True
+        """Set custom features"""
+        self.custom_features.update(self._BSB_FEATURES)
 
     def get_features(self) -> None:
         """Get device features wrapper"""
@@ -53,7 +86,7 @@ class AristonBsbDevice(AristonDevice):
     @property
     def zone_numbers(self) -> list[int]:
         """Get zone number for device"""
-        return [int(zone) for zone in self.zones]
+        return self._zone_numbers
 
     @property
     def zones(self) -> dict[str, dict[str, Any]]:
@@ -62,7 +95,7 @@ class AristonBsbDevice(AristonDevice):
 
     def get_zone(self, zone: int) -> dict[str, Any]:
         """Get device zone"""
-        return self.zones.get(str(zone), dict())
+        return self._zones_by_number.get(zone, dict())
 
     def get_zone_ch_comf_temp(self, zone: int) -> dict[str, Any]:
         """Get device zone central heating comfort temperature"""
@@ -74,23 +107,15 @@ class AristonBsbDevice(AristonDevice):
 
     def get_zone_mode(self, zone: int) -> BsbZoneMode:
         """Get zone mode on value"""
-        zone_mode = (
-            self.get_zone(zone)
-            .get(BsbZoneProperties.MODE, dict[str, Any]())
-            .get(PropertyType.VALUE, None)
+        zone_mode = self._get_zone_property(
+            zone, BsbZoneProperties.MODE, PropertyType.VALUE
         )
-
-        if zone_mode is None:
-            return BsbZoneMode.UNDEFINED
-
-        return BsbZoneMode(zone_mode)
+        return _BSB_ZONE_MODE_BY_VALUE.get(zone_mode, BsbZoneMode.UNDEFINED)
 
     def get_zone_mode_options(self, zone: int) -> list[int]:
         """Get zone mode on options"""
-        return (
-            self.get_zone(zone)
-            .get(BsbZoneProperties.MODE, dict[str, Any]())
-            .get(PropertyType.ALLOWED_OPTIONS, None)
+        return self._get_zone_property(
+            zone, BsbZoneProperties.MODE, PropertyType.ALLOWED_OPTIONS, []
         )
 
     @property
@@ -101,22 +126,15 @@ class AristonBsbDevice(AristonDevice):
     @property
     def is_plant_in_cool_mode(self) -> bool:
         """Is the plant in a cool mode"""
-        return self.get_zone(self.zone_numbers[0]).get(
-            BsbZoneProperties.COOLING_ON, False
-        )
+        return self._primary_zone.get(BsbZoneProperties.COOLING_ON, False)
 
     def is_zone_in_manual_mode(self, zone: int) -> bool:
         """Is zone in manual mode"""
-        return self.get_zone_mode(zone) in [
-            BsbZoneMode.MANUAL,
-            BsbZoneMode.MANUAL_NIGHT,
-        ]
+        return self.get_zone_mode(zone) in _BSB_ZONE_MANUAL_MODES
 
     def is_zone_in_time_program_mode(self, zone: int) -> bool:
         """Is zone in time program mode"""
-        return self.get_zone_mode(zone) in [
-            BsbZoneMode.TIME_PROGRAM,
-        ]
+        return self.get_zone_mode(zone) in _BSB_ZONE_TIME_PROGRAM_MODES
 
     def is_zone_mode_options_contains_manual(self, zone: int) -> bool:
         """Is zone mode options contains manual mode"""
@@ -137,6 +155,15 @@ class AristonBsbDevice(AristonDevice):
         """Get is flame on value"""
         return self.data.get(BsbDeviceProperties.FLAME, False)
 
+    def _get_property(
+        self, device_property: str, property_type: str, default: Any = None
+    ) -> Any:
+        """Get property type value from device data"""
+        try:
+            return self.data[device_property][property_type]
+        except (KeyError, TypeError):
+            return default
+
     @property
     def water_heater_current_temperature(self) -> Optional[float]:
         """Method for getting current water heater temperature."""
@@ -145,93 +172,78 @@ class AristonBsbDevice(AristonDevice):
     @property
     def water_heater_minimum_temperature(self) -> float:
         """Method for getting water heater minimum temperature"""
-        return self.data.get(BsbDeviceProperties.DHW_COMF_TEMP, dict[str, Any]()).get(
-            PropertyType.MIN, None
-        )
+        return self._get_property(BsbDeviceProperties.DHW_COMF_TEMP, PropertyType.MIN)
 
     @property
     def water_heater_reduced_minimum_temperature(self) -> Optional[float]:
         """Get water heater reduced temperature"""
-        return self.data.get(BsbDeviceProperties.DHW_REDU_TEMP, dict[str, Any]()).get(
-            PropertyType.MIN, None
-        )
+        return self._get_property(BsbDeviceProperties.DHW_REDU_TEMP, PropertyType.MIN)
 
     @property
     def water_heater_target_temperature(self) -> Optional[float]:
         """Method for getting water heater target temperature"""
-        return self.data.get(BsbDeviceProperties.DHW_COMF_TEMP, dict[str, Any]()).get(
-            PropertyType.VALUE, None
-        )
+        return self._get_property(BsbDeviceProperties.DHW_COMF_TEMP, PropertyType.VALUE)
 
     @property
     def water_heater_reduced_temperature(self) -> Optional[float]:
         """Get water heater reduced temperature"""
-        return self.data.get(BsbDeviceProperties.DHW_REDU_TEMP, dict[str, Any]()).get(
-            PropertyType.VALUE, None
-        )
+        return self._get_property(BsbDeviceProperties.DHW_REDU_TEMP, PropertyType.VALUE)
 
     @property
     def water_heater_maximum_temperature(self) -> Optional[float]:
         """Method for getting water heater maximum temperature"""
-        return self.data.get(BsbDeviceProperties.DHW_COMF_TEMP, dict[str, Any]()).get(
-            PropertyType.MAX, None
-        )
+        return self._get_property(BsbDeviceProperties.DHW_COMF_TEMP, PropertyType.MAX)
 
     @property
     def water_heater_reduced_maximum_temperature(self) -> Optional[float]:
         """Get water heater reduced temperature"""
-        return self.data.get(BsbDeviceProperties.DHW_REDU_TEMP, dict[str, Any]()).get(
-            PropertyType.MAX, None
-        )
+        return self._get_property(BsbDeviceProperties.DHW_REDU_TEMP, PropertyType.MAX)
 
     @property
     def water_heater_temperature_step(self) -> int:
         """Method for getting water heater temperature step"""
-        return self.data.get(BsbDeviceProperties.DHW_COMF_TEMP, dict[str, Any]()).get(
-            PropertyType.STEP, None
-        )
+        return self._get_property(BsbDeviceProperties.DHW_COMF_TEMP, PropertyType.STEP)
 
     @property
     def water_heater_reduced_temperature_step(self) -> Optional[float]:
         """Get water heater reduced temperature"""
-        return self.data.get(BsbDeviceProperties.DHW_REDU_TEMP, dict[str, Any]()).get(
-            PropertyType.STEP, None
-        )
-
-    @property
-    def water_heater_temperature_decimals(self) -> int:
-        """Method for getting water heater temperature decimals"""
-        return 1
-
-    @property
-    def water_heater_temperature_unit(self) -> str:
-        """Get water heater temperature unit"""
-        return "°C"
+        return self._get_property(BsbDeviceProperties.DHW_REDU_TEMP, PropertyType.STEP)
 
     @property
     def water_heater_mode_operation_texts(self) -> list[str]:
         """Get water heater operation mode texts"""
-        return [flag.name for flag in BsbOperativeMode]
+        return list(_BSB_OPERATIVE_MODE_TEXTS)
 
     @property
     def water_heater_mode_options(self) -> list[int]:
         """Get water heater operation options"""
-        return [flag.value for flag in BsbOperativeMode]
+        return list(_BSB_OPERATIVE_MODE_OPTIONS)
 
     @property
     def water_heater_mode_value(self) -> Optional[int]:
         """Method for getting water heater mode value"""
-        return self.data.get(BsbDeviceProperties.DHW_MODE, dict[str, Any]()).get(
-            PropertyType.VALUE, None
-        )
+        return self._get_property(BsbDeviceProperties.DHW_MODE, PropertyType.VALUE)
+
+    def _get_zone_property(
+        self, zone: int, zone_property: str, property_type: str, default: Any = None
+    ) -> Any:
+        """Get zone property type value from device data"""
+        try:
+            return self._zones_by_number[zone][zone_property][property_type]
+        except (KeyError, TypeError):
+            return default
 
     def get_comfort_temp_min(self, zone: int) -> int:
         """Get zone comfort temp min"""
-        return self.get_zone_ch_comf_temp(zone).get(PropertyType.MIN, 15)
+        return self._get_zone_property(
+            zone, BsbZoneProperties.CH_COMF_TEMP, PropertyType.MIN, 15
+        )
 
     def get_comfort_temp_max(self, zone: int) -> int:
         """Get zone comfort temp max"""
-        return self.get_zone_ch_comf_temp(zone).get(PropertyType.MAX, 24)
+        return self._get_zone_property(
+            zone, BsbZoneProperties.CH_COMF_TEMP, PropertyType.MAX, 24
+        )
 
     def get_target_temp_step(self, zone: int) -> int:
         """Get target temp step"""
@@ -239,7 +251,9 @@ class AristonBsbDevice(AristonDevice):
 
     def get_comfort_temp_step(self, zone: int) -> int:
         """Get zone comfort temp step"""
-        return self.get_zone_ch_comf_temp(zone).get(PropertyType.STEP, 0.5)
+        return self._get_zone_property(
+            zone, BsbZoneProperties.CH_COMF_TEMP, PropertyType.STEP, 0.5
+        )
 
     def get_target_temp_value(self, zone: int) -> int:
         """Get target temp value"""
@@ -247,23 +261,33 @@ class AristonBsbDevice(AristonDevice):
 
     def get_comfort_temp_value(self, zone: int) -> int:
         """Get zone comfort temp value"""
-        return self.get_zone_ch_comf_temp(zone).get(PropertyType.VALUE, 0)
+        return self._get_zone_property(
+            zone, BsbZoneProperties.CH_COMF_TEMP, PropertyType.VALUE, 0
+        )
 
     def get_reduced_temp_min(self, zone: int) -> int:
         """Get zone reduced temp min"""
-        return self.get_zone_ch_red_temp(zone).get(PropertyType.MIN, 10)
+        return self._get_zone_property(
+            zone, BsbZoneProperties.CH_RED_TEMP, PropertyType.MIN, 10
+        )
 
     def get_reduced_temp_max(self, zone: int) -> int:
         """Get zone reduced temp max"""
-        return self.get_zone_ch_red_temp(zone).get(PropertyType.MAX, 18)
+        return self._get_zone_property(
+            zone, BsbZoneProperties.CH_RED_TEMP, PropertyType.MAX, 18
+        )
 
     def get_reduced_temp_step(self, zone: int) -> int:
         """Get zone reduced temp step"""
-        return self.get_zone_ch_red_temp(zone).get(PropertyType.STEP, 0.5)
+        return self._get_zone_property(
+            zone, BsbZoneProperties.CH_RED_TEMP, PropertyType.STEP, 0.5
+        )
 
     def get_reduced_temp_value(self, zone: int) -> int:
         """Get zone reduced temp value"""
-        return self.get_zone_ch_red_temp(zone).get(PropertyType.VALUE, 0)
+        return self._get_zone_property(
+            zone, BsbZoneProperties.CH_RED_TEMP, PropertyType.VALUE, 0
+        )
 
     def get_measured_temp_value(self, zone: int) -> int:
         """Get zone measured temp value"""
@@ -279,8 +303,7 @@ class AristonBsbDevice(AristonDevice):
 
     def set_water_heater_temperature(self, temperature: float):
         """Set water heater temperature"""
-        if len(self.data) == 0:
-            self.update_state()
+        self._ensure_loaded()
         reduced = self.water_heater_reduced_temperature
         if reduced is None:
             reduced = 0
@@ -288,8 +311,7 @@ class AristonBsbDevice(AristonDevice):
 
     async def async_set_water_heater_temperature(self, temperature: float):
         """Async set water heater temperature"""
-        if len(self.data) == 0:
-            await self.async_update_state()
+        await self._async_ensure_loaded()
         reduced = self.water_heater_reduced_temperature
         if reduced is None:
             reduced = 0
@@ -297,18 +319,19 @@ class AristonBsbDevice(AristonDevice):
 
     def set_water_heater_operation_mode(self, operation_mode: str) -> None:
         """Set water heater operation mode"""
-        self.api.set_bsb_mode(self.gw, BsbOperativeMode[operation_mode])
-        self.data[BsbDeviceProperties.DHW_MODE][PropertyType.VALUE] = BsbOperativeMode[operation_mode].value
+        mode = _BSB_OPERATIVE_MODE_BY_NAME[operation_mode]
+        self.api.set_bsb_mode(self.gw, mode)
+        self.data.setdefault(BsbDeviceProperties.DHW_MODE, dict())[PropertyType.VALUE] = mode.value
 
     async def async_set_water_heater_operation_mode(self, operation_mode: str) -> None:
         """Async set water heater operation mode"""
-        await self.api.async_set_bsb_mode(self.gw, BsbOperativeMode[operation_mode])
-        self.data[BsbDeviceProperties.DHW_MODE][PropertyType.VALUE] = BsbOperativeMode[operation_mode].value
+        mode = _BSB_OPERATIVE_MODE_BY_NAME[operation_mode]
+        await self.api.async_set_bsb_mode(self.gw, mode)
+        self.data.setdefault(BsbDeviceProperties.DHW_MODE, dict())[PropertyType.VALUE] = mode.value
 
     def set_water_heater_reduced_temperature(self, temperature: float):
         """Set water heater reduced temperature"""
-        if len(self.data) == 0:
-            self.update_state()
+        self._ensure_loaded()
         current = self.water_heater_current_temperature
         if current is None:
             current = 0
@@ -316,8 +339,7 @@ class AristonBsbDevice(AristonDevice):
 
     async def async_set_water_heater_reduced_temperature(self, temperature: float):
         """Async set water heater temperature"""
-        if len(self.data) == 0:
-            await self.async_update_state()
+        await self._async_ensure_loaded()
         current = self.water_heater_current_temperature
         if current is None:
             current = 0
@@ -326,65 +348,56 @@ class AristonBsbDevice(AristonDevice):
     def _set_water_heater_temperature(self, temperature: float, reduced: float):
         """Set water heater temperature"""
         self.api.set_bsb_temperature(self.gw, temperature, reduced, self.water_heater_target_temperature, self.water_heater_reduced_temperature)
-        self.data[BsbDeviceProperties.DHW_COMF_TEMP][PropertyType.VALUE] = temperature
-        self.data[BsbDeviceProperties.DHW_REDU_TEMP][PropertyType.VALUE] = reduced
+        self.data.setdefault(BsbDeviceProperties.DHW_COMF_TEMP, dict())[PropertyType.VALUE] = temperature
+        self.data.setdefault(BsbDeviceProperties.DHW_REDU_TEMP, dict())[PropertyType.VALUE] = reduced
 
     async def _async_set_water_heater_temperature(
         self, temperature: float, reduced: float
     ):
         """Async set water heater temperature"""
         await self.api.async_set_bsb_temperature(self.gw, temperature, reduced, self.water_heater_target_temperature, self.water_heater_reduced_temperature)
-        self.data[BsbDeviceProperties.DHW_COMF_TEMP][PropertyType.VALUE] = temperature
-        self.data[BsbDeviceProperties.DHW_REDU_TEMP][PropertyType.VALUE] = reduced
+        self.data.setdefault(BsbDeviceProperties.DHW_COMF_TEMP, dict())[PropertyType.VALUE] = temperature
+        self.data.setdefault(BsbDeviceProperties.DHW_REDU_TEMP, dict())[PropertyType.VALUE] = reduced
 
     def set_zone_mode(self, zone_mode: BsbZoneMode, zone: int):
         """Set zone mode"""
         self.api.set_bsb_zone_mode(self.gw, zone, zone_mode, self.get_zone_mode(zone), self.is_plant_in_cool_mode)
-        self.get_zone(zone)[BsbZoneProperties.MODE][PropertyType.VALUE] = zone_mode
+        self.get_zone(zone)[BsbZoneProperties.MODE][PropertyType.VALUE] = zone_mode.value
 
     async def async_set_zone_mode(self, zone_mode: BsbZoneMode, zone: int):
         """Async set zone mode"""
         await self.api.async_set_bsb_zone_mode(self.gw, zone, zone_mode, self.get_zone_mode(zone), self.is_plant_in_cool_mode)
-        self.get_zone(zone)[BsbZoneProperties.MODE][PropertyType.VALUE] = zone_mode
+        self.get_zone(zone)[BsbZoneProperties.MODE][PropertyType.VALUE] = zone_mode.value
 
     @property
     def outside_temp_value(self) -> str:
         """Get outside temperature value"""
         return self.data.get(BsbDeviceProperties.OUT_TEMP, 0)
 
-    @property
-    def outside_temp_unit(self) -> str:
-        """Get outside temperature unit"""
-        return "°C"
-
     def set_comfort_temp(self, temp: float, zone: int):
         """Set central heating comfort temp"""
-        if len(self.data) == 0:
-            self.update_state()
+        self._ensure_loaded()
         reduced = self.get_reduced_temp_value(zone)
         self.api.set_bsb_zone_temperature(self.gw, zone, temp, reduced, self.get_comfort_temp_value(zone), self.get_reduced_temp_value(zone), self.is_plant_in_cool_mode)
         self.get_zone_ch_comf_temp(zone)[PropertyType.VALUE] = temp
 
     async def async_set_comfort_temp(self, temp: float, zone: int):
         """Async set central heating comfort temp"""
-        if len(self.data) == 0:
-            await self.async_update_state()
+        await self._async_ensure_loaded()
         reduced = self.get_reduced_temp_value(zone)
         await self.api.async_set_bsb_zone_temperature(self.gw, zone, temp, reduced, self.get_comfort_temp_value(zone), self.get_reduced_temp_value(zone), self.is_plant_in_cool_mode)
         self.get_zone_ch_comf_temp(zone)[PropertyType.VALUE] = temp
 
     def set_reduced_temp(self, temp: float, zone: int):
         """Set central heating reduced temp"""
-        if len(self.data) == 0:
-            self.update_state()
+        self._ensure_loaded()
         comfort = self.get_comfort_temp_value(zone)
         self.api.set_bsb_zone_temperature(self.gw, zone, comfort, temp, self.get_comfort_temp_value(zone), self.get_reduced_temp_value(zone), self.is_plant_in_cool_mode)
         self.get_zone_ch_red_temp(zone)[PropertyType.VALUE] = temp
 
     async def async_set_reduced_temp(self, temp: float, zone: int):
         """Async set central heating reduced temp"""
-        if len(self.data) == 0:
-            await self.async_update_state()
+        await self._async_ensure_loaded()
         comfort = self.get_comfort_temp_value(zone)
         await self.api.async_set_bsb_zone_temperature(self.gw, zone, comfort, temp, self.get_comfort_temp_value(zone), self.get_reduced_temp_value(zone), self.is_plant_in_cool_mode)
         self.get_zone_ch_red_temp(zone)[PropertyType.VALUE] = temp
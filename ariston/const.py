@@ -29,7 +29,7 @@ class PlantData(str, Enum):
 
 
 @unique
-class PlantMode(Enum):
+class PlantMode(IntEnum):
     """Plant mode enum"""
 
     UNDEFINED = -1
@@ -43,7 +43,7 @@ class PlantMode(Enum):
 
 
 @unique
-class ZoneMode(Enum):
+class ZoneMode(IntEnum):
     """Zone mode enum"""
 
     UNDEFINED = -1
@@ -53,7 +53,7 @@ class ZoneMode(Enum):
     TIME_PROGRAM = 3
 
 @unique
-class BsbZoneMode(Enum):
+class BsbZoneMode(IntEnum):
     """BSB zone mode enum"""
 
     UNDEFINED = -1
@@ -63,7 +63,7 @@ class BsbZoneMode(Enum):
     MANUAL_NIGHT = 3
 
 @unique
-class DhwMode(Enum):
+class DhwMode(IntEnum):
     """Dhw mode enum"""
 
     DISABLED = 0
@@ -141,7 +141,7 @@ class Currency(IntEnum):
 
 
 @unique
-class SystemType(Enum):
+class SystemType(IntEnum):
     """System type enum"""
 
     UNKNOWN = -1
@@ -170,7 +170,7 @@ class WaterHeaterMode(Enum):
 
 
 @unique
-class BsbOperativeMode(WaterHeaterMode):
+class BsbOperativeMode(int, WaterHeaterMode):
     """BSB operative mode enum"""
 
     OFF = 0
@@ -231,7 +231,7 @@ class LydosPlantMode(WaterHeaterMode):
 
 
 @unique
-class WheType(Enum):
+class WheType(IntEnum):
     """Whe type enum"""
 
     Unknown = -1
@@ -246,7 +246,7 @@ class WheType(Enum):
 
 
 @unique
-class ConsumptionType(Enum):
+class ConsumptionType(IntEnum):
     """Consumption type"""
 
     CENTRAL_HEATING_TOTAL_ENERGY = 1
@@ -261,7 +261,7 @@ class ConsumptionType(Enum):
 
 
 @unique
-class ConsumptionTimeInterval(Enum):
+class ConsumptionTimeInterval(IntEnum):
     """Consumption time interval"""
 
     # I am not sure. This is just a guess.
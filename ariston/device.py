@@ -13,6 +13,8 @@ _LOGGER = logging.getLogger(__name__)
 class AristonDevice(AristonBaseDevice, ABC):
     """Class representing a physical device, it's state and properties."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def water_heater_temperature_decimals(self) -> int:
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
 from typing import Optional
 
 from .const import (
@@ -20,6 +19,8 @@ _LOGGER = logging.getLogger(__name__)
 class AristonEvoDevice(AristonEvoLydosDevice):
     """Class representing a physical device, it's state and properties."""
 
+    __slots__ = ()
+
     @property
     def plant_data(self) -> PlantData:
         """Final string to get plant data"""
@@ -60,8 +61,8 @@ class AristonEvoDevice(AristonEvoLydosDevice):
         rm_tm = self.rm_tm_value
         if rm_tm is None:
             return -1
-        time = datetime.strptime(rm_tm, "%H:%M:%S")
-        return time.hour * 60 + time.minute
+        hours, minutes, _ = rm_tm.split(":")
+        return int(hours) * 60 + int(minutes)
 
     @property
     def water_heater_power_option_value(self) -> Optional[bool]:
@@ -94,13 +95,15 @@ class AristonEvoDevice(AristonEvoLydosDevice):
 
     def set_water_heater_operation_mode(self, operation_mode: str):
         """Set water heater operation mode"""
-        self.api.set_evo_mode(self.gw, EvoPlantMode[operation_mode])
-        self.data[EvoDeviceProperties.MODE] = EvoPlantMode[operation_mode].value
+        mode = EvoPlantMode[operation_mode]
+        self.api.set_evo_mode(self.gw, mode)
+        self.data[EvoDeviceProperties.MODE] = mode.value
 
     async def async_set_water_heater_operation_mode(self, operation_mode: str):
         """Async set water heater operation mode"""
-        await self.api.async_set_evo_mode(self.gw, EvoPlantMode[operation_mode])
-        self.data[EvoDeviceProperties.MODE] = EvoPlantMode[operation_mode].value
+        mode = EvoPlantMode[operation_mode]
+        await self.api.async_set_evo_mode(self.gw, mode)
+        self.data[EvoDeviceProperties.MODE] = mode.value
 
     def set_water_heater_temperature(self, temperature: float):
         """Set water heater temperature"""
@@ -14,6 +14,8 @@ _LOGGER = logging.getLogger(__name__)
 class AristonEvoLydosDevice(AristonVelisDevice, ABC):
     """Class representing a physical device, it's state and properties."""
 
+    __slots__ = ()
+
     @property
     def water_heater_current_temperature(self) -> Optional[float]:
         """Get water heater current temperature"""
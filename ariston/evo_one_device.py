@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
 from typing import Optional
 
 from .const import (
@@ -19,6 +18,8 @@ _LOGGER = logging.getLogger(__name__)
 class AristonEvoOneDevice(AristonVelisBaseDevice):
     """Class representing a physical device, it's state and properties."""
 
+    __slots__ = ()
+
     @property
     def plant_data(self) -> PlantData:
         """Final string to get plant data"""
@@ -60,8 +61,8 @@ class AristonEvoOneDevice(AristonVelisBaseDevice):
         rm_tm = self.rm_tm_value
         if rm_tm is None:
             return -1
-        time = datetime.strptime(rm_tm, "%H:%M:%S")
-        return time.hour * 60 + time.minute
+        hours, minutes, _ = rm_tm.split(":")
+        return int(hours) * 60 + int(minutes)
 
     def set_eco_mode(self, eco_mode: bool):
         """Set water heater eco_mode"""
@@ -75,13 +76,15 @@ class AristonEvoOneDevice(AristonVelisBaseDevice):
 
     def set_water_heater_operation_mode(self, operation_mode: str):
         """Set water heater operation mode"""
-        self.api.set_evo_mode(self.gw, VelisPlantMode[operation_mode])
-        self.data[EvoOneDeviceProperties.MODE] = VelisPlantMode[operation_mode].value
+        mode = VelisPlantMode[operation_mode]
+        self.api.set_evo_mode(self.gw, mode)
+        self.data[EvoOneDeviceProperties.MODE] = mode.value
 
     async def async_set_water_heater_operation_mode(self, operation_mode: str):
         """Async set water heater operation mode"""
-        await self.api.async_set_evo_mode(self.gw, VelisPlantMode[operation_mode])
-        self.data[EvoOneDeviceProperties.MODE] = VelisPlantMode[operation_mode].value
+        mode = VelisPlantMode[operation_mode]
+        await self.api.async_set_evo_mode(self.gw, mode)
+        self.data[EvoOneDeviceProperties.MODE] = mode.value
 
     @property
     def is_heating(self) -> Optional[bool]:
@@ -28,10 +28,36 @@ from .device import AristonDevice
 
 _LOGGER = logging.getLogger(__name__)
 
+_PLANT_HEAT_MODES = frozenset({PlantMode.WINTER, PlantMode.HEATING_ONLY})
+_PLANT_COOL_MODES = frozenset({PlantMode.COOLING, PlantMode.COOLING_ONLY})
+_PLANT_MODE_BY_VALUE: dict[int, PlantMode] = {
+    plant_mode.value: plant_mode for plant_mode in PlantMode
+}
+_ZONE_MODE_BY_VALUE: dict[int, ZoneMode] = {
+    zone_mode.value: zone_mode for zone_mode in ZoneMode
+}
+_ZONE_MANUAL_MODES = frozenset({ZoneMode.MANUAL, ZoneMode.MANUAL_NIGHT})
+_ZONE_TIME_PROGRAM_MODES = frozenset({ZoneMode.TIME_PROGRAM})
+_GAS_TYPE_NAMES: dict[int, str] = {gas_type.value: gas_type.name for gas_type in GasType}
+_CURRENCY_NAMES: dict[int, str] = {currency.value: currency.name for currency in Currency}
+_GAS_ENERGY_UNIT_NAMES: dict[int, str] = {
+    gas_energy_unit.value: gas_energy_unit.name for gas_energy_unit in GasEnergyUnit
+}
+
 
 class AristonGalevoDevice(AristonDevice):
     """Class representing a physical device, it's state and properties."""
 
+    __slots__ = (
+        "umsys",
+        "language_tag",
+        "consumptions_settings",
+        "energy_account",
+        "menu_items",
+        "_items_by_id",
+        "_consumption_type",
+    )
+
     def __init__(
         self,
         api: AristonAPI,
@@ -45,10 +71,16 @@ class AristonGalevoDevice(AristonDevice):
         self.consumptions_settings: dict[str, Any] = dict()
         self.energy_account: dict[str, Any] = dict()
         self.menu_items: list[dict[str, Any]] = list()
+        self._items_by_id: dict[tuple[str, int], dict[str, Any]] = dict()
+        self._consumption_type = self._get_consumption_type()
 
     @property
     def consumption_type(self) -> str:
         """String to get consumption type"""
+        return self._consumption_type
+
+    def _get_consumption_type(self) -> str:
+        """Build the consumption type string from the device features"""
         return f"Ch{'%2CDhw' if self.has_dhw else ''}{'%2CCooling' if self.hpmp_sys else ''}"
 
     @property
@@ -59,25 +91,21 @@ class AristonGalevoDevice(AristonDevice):
     def _update_state(self) -> None:
         """Set custom features"""
         if self.custom_features.get(CustomDeviceFeatures.HAS_OUTSIDE_TEMP) is None:
-            temp = self._get_item_by_id(
-                DeviceProperties.OUTSIDE_TEMP, PropertyType.VALUE
-            )
-            max_temp = self._get_item_by_id(
-                DeviceProperties.OUTSIDE_TEMP, PropertyType.MAX
+            outside_temp = self._items_by_id.get(
+                (DeviceProperties.OUTSIDE_TEMP, 0), dict()
             )
             self.custom_features[CustomDeviceFeatures.HAS_OUTSIDE_TEMP] = (
-                temp != max_temp
+                outside_temp.get(PropertyType.VALUE) != outside_temp.get(PropertyType.MAX)
             )
 
         if self.custom_features.get(DeviceProperties.DHW_STORAGE_TEMPERATURE) is None:
-            storage_temp = self._get_item_by_id(
-                DeviceProperties.DHW_STORAGE_TEMPERATURE, PropertyType.VALUE
-            )
-            max_storage_temp = self._get_item_by_id(
-                DeviceProperties.DHW_STORAGE_TEMPERATURE, PropertyType.MAX
+            dhw_storage_temp = self._items_by_id.get(
+                (DeviceProperties.DHW_STORAGE_TEMPERATURE, 0), dict()
             )
+            storage_temp = dhw_storage_temp.get(PropertyType.VALUE)
             self.custom_features[DeviceProperties.DHW_STORAGE_TEMPERATURE] = (
-                storage_temp is not None and storage_temp != max_storage_temp
+                storage_temp is not None
+                and storage_temp != dhw_storage_temp.get(PropertyType.MAX)
             )
 
         self.custom_features[DeviceProperties.CH_FLOW_TEMP] = self.ch_flow_temp_value is not None
@@ -85,7 +113,7 @@ class AristonGalevoDevice(AristonDevice):
 
     def update_state(self) -> None:
         """Update the device states from the cloud"""
-        if len(self.features) == 0:
+        if not self.features:
             self.get_features()
 
         self.data = self.api.get_properties(
@@ -95,11 +123,12 @@ class AristonGalevoDevice(AristonDevice):
             self.umsys,
         )
         self.menu_items = self.api.get_menu_items(self.gw)
+        self._index_items()
         self._update_state()
 
     async def async_update_state(self) -> None:
         """Async update the device states from the cloud"""
-        if len(self.features) == 0:
+        if not self.features:
             await self.async_get_features()
 
         (self.data, self.menu_items) = await asyncio.gather(
@@ -111,8 +140,17 @@ class AristonGalevoDevice(AristonDevice):
             ),
             self.api.async_get_menu_items(self.gw)
         )
+        self._index_items()
         self._update_state()
 
+    def _index_items(self) -> None:
+        """Index the items of the current data by id and zone"""
+        # Reversed so the first item wins if the cloud sends duplicates
+        self._items_by_id = {
+            (item.get("id"), item.get(PropertyType.ZONE)): item
+            for item in reversed(self.data.get("items", list[dict[str, Any]]()))
+        }
+
     def _get_features(self) -> None:
         """Set custom features"""
         self.custom_features[CustomDeviceFeatures.HAS_DHW] = (
@@ -121,6 +159,7 @@ class AristonGalevoDevice(AristonDevice):
             self.features.get(DeviceFeatures.DHW_MODE_CHANGEABLE, False) or
             self.features.get(DeviceFeatures.DHW_PROG_SUPPORTED, False)
         )
+        self._consumption_type = self._get_consumption_type()
 
     def get_features(self) -> None:
         """Get device features wrapper"""
@@ -211,31 +250,20 @@ class AristonGalevoDevice(AristonDevice):
     @property
     def is_plant_in_heat_mode(self) -> bool:
         """Is the plant in a heat mode"""
-        return self.plant_mode in [
-            PlantMode.WINTER,
-            PlantMode.HEATING_ONLY,
-        ]
+        return self.plant_mode in _PLANT_HEAT_MODES
 
     @property
     def is_plant_in_cool_mode(self) -> bool:
         """Is the plant in a cool mode"""
-        return self.plant_mode in [
-            PlantMode.COOLING,
-            PlantMode.COOLING_ONLY,
-        ]
+        return self.plant_mode in _PLANT_COOL_MODES
 
     def is_zone_in_manual_mode(self, zone: int) -> bool:
         """Is zone in manual mode"""
-        return self.get_zone_mode(zone) in [
-            ZoneMode.MANUAL,
-            ZoneMode.MANUAL_NIGHT,
-        ]
+        return self.get_zone_mode(zone) in _ZONE_MANUAL_MODES
 
     def is_zone_in_time_program_mode(self, zone: int) -> bool:
         """Is zone in time program mode"""
-        return self.get_zone_mode(zone) in [
-            ZoneMode.TIME_PROGRAM,
-        ]
+        return self.get_zone_mode(zone) in _ZONE_TIME_PROGRAM_MODES
 
     def is_zone_mode_options_contains_manual(self, zone: int) -> bool:
         """Is zone mode options contains manual mode"""
@@ -406,11 +434,7 @@ class AristonGalevoDevice(AristonDevice):
         if zone_mode is None:
             return ZoneMode.UNDEFINED
 
-        return ZoneMode(
-            self._get_item_by_id(
-                ThermostatProperties.ZONE_MODE, PropertyType.VALUE, zone
-            )
-        )
+        return _ZONE_MODE_BY_VALUE.get(zone_mode, ZoneMode.UNDEFINED)
 
     def get_zone_mode_options(self, zone: int) -> list[int]:
         """Get zone mode on options"""
@@ -428,7 +452,7 @@ class AristonGalevoDevice(AristonDevice):
         if plant_mode is None:
             return PlantMode.UNDEFINED
 
-        return PlantMode(plant_mode)
+        return _PLANT_MODE_BY_VALUE.get(plant_mode, PlantMode.UNDEFINED)
 
     @property
     def plant_mode_options(self) -> list[int]:
@@ -443,14 +467,16 @@ class AristonGalevoDevice(AristonDevice):
     @property
     def plant_mode_text(self) -> str:
         """Get plant mode on option texts"""
-        current_plant_mode = self.plant_mode.value
-        plant_mode_options = self.plant_mode_options
-        if current_plant_mode in plant_mode_options:
-            index = plant_mode_options.index(current_plant_mode)
-            return self._get_item_by_id(
-                DeviceProperties.PLANT_MODE, PropertyType.OPT_TEXTS
-            )[index]
-        return PlantMode.UNDEFINED.name
+        plant_mode_item = self._items_by_id.get((DeviceProperties.PLANT_MODE, 0))
+        if plant_mode_item is None:
+            return PlantMode.UNDEFINED.name
+        try:
+            index = plant_mode_item[PropertyType.OPTIONS].index(
+                plant_mode_item[PropertyType.VALUE]
+            )
+            return plant_mode_item[PropertyType.OPT_TEXTS][index]
+        except (KeyError, ValueError, IndexError, AttributeError):
+            return PlantMode.UNDEFINED.name
 
     @property
     def signal_strength_value(self) -> Any:
@@ -602,15 +628,10 @@ class AristonGalevoDevice(AristonDevice):
         self, item_id: str, item_value: str, zone_number: int = 0
     ) -> Any:
         """Get item attribute from data"""
-        return next(
-            (
-                item.get(item_value)
-                for item in self.data.get("items", list[dict[str, Any]]())
-                if item.get("id") == item_id
-                and item.get(PropertyType.ZONE) == zone_number
-            ),
-            None,
-        )
+        item = self._items_by_id.get((item_id, zone_number))
+        if item is None:
+            return None
+        return item.get(item_value)
 
     def _get_menu_item_by_id(
         self, menu_item_id: int, item_value: str
@@ -639,14 +660,12 @@ class AristonGalevoDevice(AristonDevice):
     def gas_type(self) -> Optional[str]:
         """Get gas type"""
         gas_type = self.consumptions_settings.get(ConsumptionProperties.GAS_TYPE, None)
-        if gas_type in list(GasType):
-            return GasType(gas_type).name
-        return None
+        return _GAS_TYPE_NAMES.get(gas_type, None)
 
     @staticmethod
     def get_gas_types() -> list[Optional[str]]:
         """Get all gas types"""
-        return [c.name for c in GasType]
+        return list(_GAS_TYPE_NAMES.values())
 
     def set_gas_type(self, selected: str):
         """Set gas type"""
@@ -664,14 +683,12 @@ class AristonGalevoDevice(AristonDevice):
     def currency(self) -> Optional[str]:
         """Get gas type"""
         currency = self.consumptions_settings.get(ConsumptionProperties.CURRENCY, None)
-        if currency in list(Currency):
-            return Currency(currency).name
-        return None
+        return _CURRENCY_NAMES.get(currency, None)
 
     @staticmethod
     def get_currencies() -> list[Optional[str]]:
         """Get all currency"""
-        return [c.name for c in Currency]
+        return list(_CURRENCY_NAMES.values())
 
     def set_currency(self, selected: str):
         """Set currency"""
@@ -689,14 +706,12 @@ class AristonGalevoDevice(AristonDevice):
     def gas_energy_unit(self) -> Optional[str]:
         """Get gas energy unit"""
         gas_energy_unit = self.consumptions_settings.get(ConsumptionProperties.GAS_ENERGY_UNIT, None)
-        if gas_energy_unit in list(GasEnergyUnit):
-            return GasEnergyUnit(gas_energy_unit).name
-        return None
+        return _GAS_ENERGY_UNIT_NAMES.get(gas_energy_unit, None)
 
     @staticmethod
     def get_gas_energy_units() -> list[Optional[str]]:
         """Get all gas energy unit"""
-        return [c.name for c in GasEnergyUnit]
+        return list(_GAS_ENERGY_UNIT_NAMES.values())
 
     def set_gas_energy_unit(self, selected: str):
         """Set gas energy unit"""
@@ -924,10 +939,9 @@ class AristonGalevoDevice(AristonDevice):
         value: float,
         zone_number: int = 0,
     ):
-        for item in self.data.get("items", list[dict[str, Any]]()):
-            if item.get("id") == item_id and item.get(PropertyType.ZONE) == zone_number:
-                item[PropertyType.VALUE] = value
-                break
+        item = self._items_by_id.get((item_id, zone_number))
+        if item is not None:
+            item[PropertyType.VALUE] = value
 
     def set_item_by_id(
         self,
@@ -974,13 +988,12 @@ class AristonGalevoDevice(AristonDevice):
         )
 
     def _set_holiday(self, holiday_end_date: Optional[str]):
-        for item in self.data.get("items", list[dict[str, Any]]()):
-            if item.get("id") == DeviceProperties.HOLIDAY:
-                item[PropertyType.VALUE] = False if holiday_end_date is None else True
-                item[PropertyType.EXPIRES_ON] = (
-                    None if holiday_end_date is None else holiday_end_date
-                )
-                break
+        item = self._items_by_id.get((DeviceProperties.HOLIDAY, 0))
+        if item is not None:
+            item[PropertyType.VALUE] = False if holiday_end_date is None else True
+            item[PropertyType.EXPIRES_ON] = (
+                None if holiday_end_date is None else holiday_end_date
+            )
 
     def set_holiday(self, holiday_end: date):
         """Set holiday on device"""
@@ -996,16 +1009,24 @@ class AristonGalevoDevice(AristonDevice):
 
     def _calc_energy_account(self) -> dict[str, Any]:
         """Calculate the energy account"""
-        calculated_heating_energy = 0
-        calculated_cooling_energy = 0
-
-        for sequence in self.consumptions_sequences:
-            if sequence['p'] == ConsumptionTimeInterval.LAST_MONTH.value:
-                if sequence['k'] == ConsumptionType.CENTRAL_COOLING_TOTAL_ENERGY.value:
-                    calculated_cooling_energy = sum(sequence['v'])
-
-                elif sequence['k'] == ConsumptionType.CENTRAL_HEATING_TOTAL_ENERGY.value:
-                    calculated_heating_energy = sum(sequence['v'])
+        calculated_heating_energy = sum(
+            self._consumptions_sequences_index.get(
+                (
+                    ConsumptionType.CENTRAL_HEATING_TOTAL_ENERGY.value,
+                    ConsumptionTimeInterval.LAST_MONTH.value,
+                ),
+                [],
+            )
+        )
+        calculated_cooling_energy = sum(
+            self._consumptions_sequences_index.get(
+                (
+                    ConsumptionType.CENTRAL_COOLING_TOTAL_ENERGY.value,
+                    ConsumptionTimeInterval.LAST_MONTH.value,
+                ),
+                [],
+            )
+        )
 
         return {'LastMonth': [{'elect': calculated_heating_energy,'cool': calculated_cooling_energy}] }
 
@@ -11,6 +11,8 @@ _LOGGER = logging.getLogger(__name__)
 class AristonLux2Device(AristonEvoDevice):
     """Class representing a physical device, it's state and properties."""
 
+    __slots__ = ()
+
     def set_water_heater_power_option(self, power_option: bool):
         """Set water heater power option"""
         self.api.set_lux_power_option(self.gw, power_option)
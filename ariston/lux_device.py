@@ -18,6 +18,8 @@ _LOGGER = logging.getLogger(__name__)
 class AristonLuxDevice(AristonEvoDevice):
     """Class representing a physical device, it's state and properties."""
 
+    __slots__ = ()
+
     @property
     def water_heater_mode(self) -> type[WaterHeaterMode]:
         """Return the water heater mode class"""
@@ -25,18 +27,20 @@ class AristonLuxDevice(AristonEvoDevice):
 
     def set_water_heater_operation_mode(self, operation_mode: str):
         """Set water heater operation mode"""
-        self.api.set_evo_mode(self.gw, LuxPlantMode[operation_mode])
-        self.data[EvoDeviceProperties.MODE] = LuxPlantMode[operation_mode].value
+        mode = LuxPlantMode[operation_mode]
+        self.api.set_evo_mode(self.gw, mode)
+        self.data[EvoDeviceProperties.MODE] = mode.value
 
     async def async_set_water_heater_operation_mode(self, operation_mode: str):
         """Async set water heater operation mode"""
-        await self.api.async_set_evo_mode(self.gw, LuxPlantMode[operation_mode])
-        self.data[EvoDeviceProperties.MODE] = LuxPlantMode[operation_mode].value
+        mode = LuxPlantMode[operation_mode]
+        await self.api.async_set_evo_mode(self.gw, mode)
+        self.data[EvoDeviceProperties.MODE] = mode.value
 
     @property
     def water_heater_target_temperature(self) -> Optional[float]:
         """Get water heater target temperature"""
-        if self.data.get(EvoDeviceProperties.MODE) == LuxPlantMode.BOOST:
+        if self.data.get(EvoDeviceProperties.MODE) == LuxPlantMode.BOOST.value:
             return self.water_heater_maximum_setpoint_temperature_maximum
         else:
             return self.data.get(EvoLydosDeviceProperties.REQ_TEMP, None)
@@ -20,6 +20,8 @@ _LOGGER = logging.getLogger(__name__)
 class AristonLydosHybridDevice(AristonEvoLydosDevice):
     """Class representing a physical device, it's state and properties."""
 
+    __slots__ = ()
+
     @property
     def plant_data(self) -> PlantData:
         """Final string to get plant data"""
@@ -128,13 +130,15 @@ class AristonLydosHybridDevice(AristonEvoLydosDevice):
 
     def set_water_heater_operation_mode(self, operation_mode: str):
         """Set water heater operation mode"""
-        self.api.set_lydos_mode(self.gw, LydosPlantMode[operation_mode])
-        self.data[LydosDeviceProperties.MODE] = LydosPlantMode[operation_mode].value
+        mode = LydosPlantMode[operation_mode]
+        self.api.set_lydos_mode(self.gw, mode)
+        self.data[LydosDeviceProperties.MODE] = mode.value
 
     async def async_set_water_heater_operation_mode(self, operation_mode: str):
         """Async set water heater operation mode"""
-        await self.api.async_set_lydos_mode(self.gw, LydosPlantMode[operation_mode])
-        self.data[LydosDeviceProperties.MODE] = LydosPlantMode[operation_mode].value
+        mode = LydosPlantMode[operation_mode]
+        await self.api.async_set_lydos_mode(self.gw, mode)
+        self.data[LydosDeviceProperties.MODE] = mode.value
 
     def set_water_heater_temperature(self, temperature: float):
         """Set water heater temperature"""
@@ -18,6 +18,8 @@ _LOGGER = logging.getLogger(__name__)
 class AristonNuosSplitDevice(AristonVelisDevice):
     """Class representing a physical device, it's state and properties."""
 
+    __slots__ = ()
+
     @property
     def plant_data(self) -> PlantData:
         """Final string to get plant data"""
@@ -130,8 +132,7 @@ class AristonNuosSplitDevice(AristonVelisDevice):
 
     def set_water_heater_temperature(self, temperature: float):
         """Set water heater temperature"""
-        if len(self.data) == 0:
-            self.update_state()
+        self._ensure_loaded()
         reduced = self.water_heater_reduced_temperature
         if reduced is None:
             reduced = 0
@@ -147,8 +148,7 @@ class AristonNuosSplitDevice(AristonVelisDevice):
 
     async def async_set_water_heater_temperature(self, temperature: float):
         """Async set water heater temperature"""
-        if len(self.data) == 0:
-            await self.async_update_state()
+        await self._async_ensure_loaded()
         reduced = self.water_heater_reduced_temperature
         if reduced is None:
             reduced = 0
@@ -156,8 +156,7 @@ class AristonNuosSplitDevice(AristonVelisDevice):
 
     def set_water_heater_reduced_temperature(self, temperature: float):
         """Set water heater reduced temperature"""
-        if len(self.data) == 0:
-            self.update_state()
+        self._ensure_loaded()
         current = self.water_heater_current_temperature
         if current is None:
             current = 0
@@ -165,8 +164,7 @@ class AristonNuosSplitDevice(AristonVelisDevice):
 
     async def async_set_water_heater_reduced_temperature(self, temperature: float):
         """Set water heater reduced temperature"""
-        if len(self.data) == 0:
-            await self.async_update_state()
+        await self._async_ensure_loaded()
         current = self.water_heater_current_temperature
         if current is None:
             current = self.water_heater_minimum_temperature
@@ -174,22 +172,19 @@ class AristonNuosSplitDevice(AristonVelisDevice):
 
     def set_water_heater_operation_mode(self, operation_mode: str):
         """Set water heater operation mode"""
-        self.api.set_nuos_mode(self.gw, NuosSplitOperativeMode[operation_mode])
-        self.data[NuosSplitProperties.MODE] = NuosSplitOperativeMode[
-            operation_mode
-        ].value
+        mode = NuosSplitOperativeMode[operation_mode]
+        self.api.set_nuos_mode(self.gw, mode)
+        self.data[NuosSplitProperties.OP_MODE] = mode.value
 
     async def async_set_water_heater_operation_mode(self, operation_mode: str):
         """Async set water heater operation mode"""
-        await self.api.async_set_nuos_mode(
-            self.gw, NuosSplitOperativeMode[operation_mode]
-        )
-        self.data[NuosSplitProperties.MODE] = NuosSplitOperativeMode[
-            operation_mode
-        ].value
+        mode = NuosSplitOperativeMode[operation_mode]
+        await self.api.async_set_nuos_mode(self.gw, mode)
+        self.data[NuosSplitProperties.OP_MODE] = mode.value
 
     def set_min_setpoint_temp(self, min_setpoint_temp: float):
         """Set water heater minimum setpoint temperature"""
+        self._ensure_settings_loaded()
         self.api.set_velis_plant_setting(
             self.plant_data,
             self.gw,
@@ -203,6 +198,7 @@ class AristonNuosSplitDevice(AristonVelisDevice):
 
     async def async_set_min_setpoint_temp(self, min_setpoint_temp: float):
         """Async set water heater minimum setpoint temperature"""
+        await self._async_ensure_settings_loaded()
         await self.api.async_set_velis_plant_setting(
             self.plant_data,
             self.gw,
@@ -216,6 +212,7 @@ class AristonNuosSplitDevice(AristonVelisDevice):
 
     def set_preheating(self, preheating: bool):
         """Set water heater preheating"""
+        self._ensure_settings_loaded()
         self.api.set_velis_plant_setting(
             self.plant_data,
             self.gw,
@@ -227,6 +224,7 @@ class AristonNuosSplitDevice(AristonVelisDevice):
 
     async def async_set_preheating(self, preheating: bool):
         """Async set water heater preheating"""
+        await self._async_ensure_settings_loaded()
         await self.api.async_set_velis_plant_setting(
             self.plant_data,
             self.gw,
@@ -238,6 +236,7 @@ class AristonNuosSplitDevice(AristonVelisDevice):
 
     def set_heating_rate(self, heating_rate: float):
         """Set water heater heating rate"""
+        self._ensure_settings_loaded()
         self.api.set_velis_plant_setting(
             self.plant_data,
             self.gw,
@@ -249,6 +248,7 @@ class AristonNuosSplitDevice(AristonVelisDevice):
 
     async def async_set_heating_rate(self, heating_rate: float):
         """Async set water heater heating rate"""
+        await self._async_ensure_settings_loaded()
         await self.api.async_set_velis_plant_setting(
             self.plant_data,
             self.gw,
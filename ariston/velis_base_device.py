@@ -1,8 +1,10 @@
 """Velis device class for Ariston module."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
+from functools import cache
 from typing import Any, Optional
 
 from .ariston_api import AristonAPI
@@ -18,9 +20,23 @@ from .base_device import AristonBaseDevice
 _LOGGER = logging.getLogger(__name__)
 
 
+@cache
+def _get_mode_texts(water_heater_mode: type[WaterHeaterMode]) -> tuple[str, ...]:
+    """Get the operation mode texts of a water heater mode enum"""
+    return tuple(flag.name for flag in water_heater_mode)
+
+
+@cache
+def _get_mode_options(water_heater_mode: type[WaterHeaterMode]) -> tuple[int, ...]:
+    """Get the operation mode options of a water heater mode enum"""
+    return tuple(flag.value for flag in water_heater_mode)
+
+
 class AristonVelisBaseDevice(AristonBaseDevice, ABC):
     """Class representing a physical device, it's state and properties."""
 
+    __slots__ = ("plant_settings",)
+
     def __init__(
         self,
         api: AristonAPI,
@@ -59,6 +75,23 @@ class AristonVelisBaseDevice(AristonBaseDevice, ABC):
             self.plant_data, self.gw
         )
 
+    def _ensure_settings_loaded(self) -> None:
+        """Update the device settings if they were not fetched yet"""
+        if not self.plant_settings:
+            self.update_settings()
+
+    async def _async_ensure_settings_loaded(self) -> None:
+        """Async update the device settings if they were not fetched yet"""
+        if not self.plant_settings:
+            await self.async_update_settings()
+
+    async def async_update_state_and_settings(self) -> None:
+        """Async update the device states and settings from the cloud"""
+        await asyncio.gather(
+            self.async_update_state(),
+            self.async_update_settings(),
+        )
+
     def set_power(self, power: bool):
         """Set water heater power"""
         self.api.set_velis_power(self.plant_data, self.gw, power)
@@ -72,12 +105,12 @@ class AristonVelisBaseDevice(AristonBaseDevice, ABC):
     @property
     def water_heater_mode_operation_texts(self) -> list[str]:
         """Get water heater operation mode texts"""
-        return [flag.name for flag in self.water_heater_mode]
+        return list(_get_mode_texts(self.water_heater_mode))
 
     @property
     def water_heater_mode_options(self) -> list[int]:
         """Get water heater operation options"""
-        return [flag.value for flag in self.water_heater_mode]
+        return list(_get_mode_options(self.water_heater_mode))
 
     def get_features(self) -> None:
         """Get device features wrapper"""
@@ -1,6 +1,7 @@
 """Velis device class for Ariston module."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 from typing import Any, Optional
@@ -16,6 +17,8 @@ _LOGGER = logging.getLogger(__name__)
 class AristonVelisDevice(AristonDevice, AristonVelisBaseDevice, ABC):
     """Class representing a physical device, it's state and properties."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         api: AristonAPI,
@@ -46,6 +49,7 @@ class AristonVelisDevice(AristonDevice, AristonVelisBaseDevice, ABC):
 
     def set_antilegionella(self, anti_leg: bool):
         """Set water heater anti-legionella"""
+        self._ensure_settings_loaded()
         self.api.set_velis_plant_setting(
             self.plant_data,
             self.gw,
@@ -57,6 +61,7 @@ class AristonVelisDevice(AristonDevice, AristonVelisBaseDevice, ABC):
 
     async def async_set_antilegionella(self, anti_leg: bool):
         """Async set water heater anti-legionella"""
+        await self._async_ensure_settings_loaded()
         await self.api.async_set_velis_plant_setting(
             self.plant_data,
             self.gw,
@@ -68,6 +73,7 @@ class AristonVelisDevice(AristonDevice, AristonVelisBaseDevice, ABC):
 
     def set_max_setpoint_temp(self, max_setpoint_temp: float):
         """Set water heater maximum setpoint temperature"""
+        self._ensure_settings_loaded()
         self.api.set_velis_plant_setting(
             self.plant_data,
             self.gw,
@@ -79,6 +85,7 @@ class AristonVelisDevice(AristonDevice, AristonVelisBaseDevice, ABC):
 
     async def async_set_max_setpoint_temp(self, max_setpoint_temp: float):
         """Async set water heater maximum setpoint temperature"""
+        await self._async_ensure_settings_loaded()
         await self.api.async_set_velis_plant_setting(
             self.plant_data,
             self.gw,
@@ -88,6 +95,40 @@ class AristonVelisDevice(AristonDevice, AristonVelisBaseDevice, ABC):
         )
         self.plant_settings[self.max_setpoint_temp] = max_setpoint_temp
 
+    def set_plant_settings(self, plant_settings: dict[str, float]):
+        """Set water heater plant settings in the cloud encoding, e.g. 1.0/0.0 for anti-legionella"""
+        self._ensure_settings_loaded()
+        for plant_setting, value in plant_settings.items():
+            self.api.set_velis_plant_setting(
+                self.plant_data,
+                self.gw,
+                plant_setting,
+                value,
+                self.plant_settings[plant_setting],
+            )
+            self.plant_settings[plant_setting] = value
+
+    async def async_set_plant_settings(self, plant_settings: dict[str, float]):
+        """Async set water heater plant settings concurrently in the cloud encoding"""
+        await self._async_ensure_settings_loaded()
+        await asyncio.gather(
+            *(
+                self._async_set_plant_setting(plant_setting, value)
+                for plant_setting, value in plant_settings.items()
+            )
+        )
+
+    async def _async_set_plant_setting(self, plant_setting: str, value: float):
+        """Async set one water heater plant setting and cache it once written"""
+        await self.api.async_set_velis_plant_setting(
+            self.plant_data,
+            self.gw,
+            plant_setting,
+            value,
+            self.plant_settings[plant_setting],
+        )
+        self.plant_settings[plant_setting] = value
+
     @property
     @abstractmethod
     def water_heater_maximum_setpoint_temperature_minimum(self) -> Optional[float]: